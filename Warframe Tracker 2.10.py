@@ -2,54 +2,581 @@
 # - Restore Complete Checked behavior from 2.09
 # - Add requested line breaks in weekly quests section
 # - Preserve all existing functionality and structure
+# - Keep one persistent row widget per task; refreshes only pack/forget rows that changed
+# - Re-render only the column whose task state changed, driven by BooleanVar traces
+# - Timer rows are persistent; the minute tick only updates their text in place
+# - Optional virtualized task columns (--renderer virtual) that only build rows in view
+# - Optional canvas-drawn task columns (--renderer canvas) with no widget per task
+# - Optional ttk.Treeview task columns (--renderer tree); Complete Checked uses the tree selection
+# - Column layouts come from one cached planner shared by the main window and settings
+# - Settings window is built once and then shown/hidden instead of rebuilt
+# - Settings edits are batched: section All/None, optional deferred Apply, one refresh and one save
+# - Scroll region updates are coalesced to one per idle cycle and skipped when the size is unchanged
+# - One scheduler with named, de-duplicated jobs replaces the separate root.after polling chains
+# - Resets are armed for the exact 00:00 UTC rollover and re-armed after sleep/resume
+# - Custom timers are declarative cadences (anchor, period, presence window) with O(1) lookups
+# - Completion is stored as the period it happened in, so resets need no per-task work or saves
+# - Optional low-power mode (--low-power) that sleeps until a visible label changes; its header shows one decimal
+# - Rendering pauses while the window is minimized (or fully covered, on X11 only), with one catch-up frame on restore
+# - Optional live countdowns (--live) on one aligned 1 s tick; --bench-live fails above 1% of one core
+# - Upcoming events window backed by a precomputed event horizon, with .ics export
+# - Injectable clock and a headless --simulate START END replay of resets, timer transitions and expiring completions
+# - Configurable reminders before resets/Baro, delivered via notify-send or an in-app toast
+# - Tasks are identified by integer ids from a registry with precomputed daily/weekly/section/timer id arrays
+# - Task state lives in compact array columns; Tk variables exist only for rows on screen
+# - Bulk edits run in one batch(): one UI pass and one save per batch
+# - Catalog, state, resets, reminders and persistence live in tracker_core.TrackerCore, importable without tkinter
+# - Sections, tasks, separators, cadences and default visibility come from tracker_catalog.json, compiled at startup
 
 import tkinter as tk
-from tkinter import ttk
-from datetime import datetime, timedelta, timezone
+from tkinter import ttk, filedialog
+import tkinter.font as tkfont
+from datetime import datetime, timezone
+from bisect import bisect_left, bisect_right
+from collections import deque
+import argparse
+import heapq
+import itertools
 import json
+import math
 import os
+import shutil
+import subprocess
+import sys
+import time
+
+from tracker_core import (
+    COUNTDOWNS, EXTRA_TIMERS, REGISTRY, SHOW_ALL, TrackerCore,
+    format_countdown, next_daily_reset, next_header_change, next_timer_label_change, plan_layout,
+    row_text, simulate, timer_label,
+)
 
-STATE_FILE = "tasktracker_state.json"
 WINDOW_POS_FILE = "window_position.json"
 
-WEEKLY_TASKS = {
-    "Vendors": [
-        "Iron Wake", "Teshin", "Maroo", "Nora", "Bird 3",
-        "Acrithis - Riven/Forma/Adapter", "Archimedean Yonta - Kuva"
-    ],
-    "Quests": [
-    "Archon Hunt",
-    "---",
-    "Deep Archimedea",
-    "Temporal Archimedea",
-    "Netracell",
-    "---",
-    "Circuit",
-    "SP Circuit",
-    "---",
-    "Hex Calendar",
-    "Kahl",
-    "Helminth Invigoration"
-]
-}
-
-DAILY_TASKS = {
-    "Quests": [
-        "Tribute", "Sortie", "KIM", "Syndicate Missions", "Steel Path Incursions"
-    ],
-    "Reputation": [
-        "Ostron", "Quills", "---", "Solaris", "Ventkids", "Solaris Vox", "---",
-        "Entrati", "Necraloid", "Cavia", "---", "Holdfasts", "---", "Hex", "---",
-        "Cephalon Simaris", "Conclave"
-    ],
-    "Vendor": ["Acrithis - Arcanes"]
-}
-
-EXTRA_TIMERS = ["Tenet Weapon Reset", "Coda Weapon Reset", "Baro Ki'Teer"]
+
+class Scheduler:
+    """Named jobs sharing a single Tk after() handle.
+
+    Jobs live in a heap ordered by wall-clock due time. Scheduling a name that is
+    already pending replaces it, so a job can never run twice per due time. Jobs never
+    run early: the wakeup for the earliest job is pushed back to the latest job due
+    within COALESCE seconds of it, and all of them run together.
+    """
+
+    COALESCE = 0.25
+    # Longest single after() wait. Tk timers may not advance while the machine sleeps, so
+    # the scheduler wakes at least this often (running nothing) to notice wall-clock jumps.
+    MAX_WAIT = 900
+    JUMP_TOLERANCE = 5
+
+    def __init__(self, root, clock=time.time):
+        self.root = root
+        self.clock = clock
+        self.heap = []     # [due, seq, name, callback]; callback None once cancelled
+        self.jobs = {}     # name -> live heap entry
+        self.seq = itertools.count()
+        self.handle = None
+        self.armed_for = None
+        self.armed_at = None       # (wall, monotonic) when the handle was armed
+        self.clock_jump_listeners = []
+        self.wakeup_listeners = []
+        self.wakeups = deque()     # wall time of every wakeup in the last hour
+
+    def schedule(self, name, delay, callback):
+        self.at(name, self.clock() + delay, callback)
+
+    def at(self, name, due, callback):
+        old = self.jobs.get(name)
+        if old is not None:
+            old[3] = None
+        entry = [due, next(self.seq), name, callback]
+        self.jobs[name] = entry
+        heapq.heappush(self.heap, entry)
+        self.rearm()
+
+    def cancel(self, name):
+        entry = self.jobs.pop(name, None)
+        if entry is not None:
+            entry[3] = None
+            self.rearm()
+
+    def pending(self):
+        # (name, due) for every live job, soonest first
+        return sorted(((entry[2], entry[0]) for entry in self.jobs.values()), key=lambda job: job[1])
+
+    def rearm(self):
+        while self.heap and self.heap[0][3] is None:
+            heapq.heappop(self.heap)
+        due = None
+        if self.heap:
+            first = self.heap[0][0]
+            due = max(entry[0] for entry in self.jobs.values() if entry[0] <= first + self.COALESCE)
+        if due == self.armed_for:
+            return
+        if self.handle is not None:
+            self.root.after_cancel(self.handle)
+            self.handle = None
+        self.armed_for = due
+        if due is not None:
+            now = self.clock()
+            self.armed_at = (now, time.monotonic())
+            delay_ms = math.ceil(min(max(due - now, 0), self.MAX_WAIT) * 1000)
+            self.handle = self.root.after(delay_ms, self.run)
+
+    def wakeups_per_hour(self):
+        horizon = self.clock() - 3600
+        while self.wakeups and self.wakeups[0] < horizon:
+            self.wakeups.popleft()
+        return len(self.wakeups)
+
+    def run(self):
+        self.handle = None
+        self.armed_for = None
+        now = self.clock()
+        self.wakeups.append(now)
+        wall_at, mono_at = self.armed_at
+        if abs((now - wall_at) - (time.monotonic() - mono_at)) > self.JUMP_TOLERANCE:
+            # Suspend/resume or a clock change: let listeners re-arm boundary jobs first
+            for listener in self.clock_jump_listeners:
+                listener()
+        cutoff = self.clock()
+        due = []
+        while self.heap and (self.heap[0][3] is None or self.heap[0][0] <= cutoff):
+            entry = heapq.heappop(self.heap)
+            if entry[3] is not None:
+                del self.jobs[entry[2]]
+                due.append(entry[3])
+        for callback in due:
+            callback()
+        self.rearm()
+        for listener in self.wakeup_listeners:
+            listener()
+
+
+def column_width(app):
+    # Wide enough for the longest task name plus indent and check indicator
+    font = tkfont.Font(font=app.font_task)
+    return max(font.measure(record.name) for record in REGISTRY.records) + 60
+
+
+class TaskColumn:
+    """Keyed pool of row widgets for one task column.
+
+    Each header, separator and task gets one persistent widget the first time it is
+    needed. render() only packs rows that appear and forgets rows that disappear;
+    rows never change relative order, so everything else is left untouched.
+    """
+
+    def __init__(self, app, parent, column="selected", command=None):
+        self.app = app
+        self.parent = parent
+        self.column = column  # TaskState flag column the row checkbuttons edit
+        self.command = command
+        self.rows = {}     # row key -> widget
+        self.shown = ()    # row keys currently packed, in order
+        self.texts = {}    # row key -> text last pushed to the widget
+        self.bound = True  # Shown task rows hold a Tk variable; hidden ones hold none
+
+    def row(self, key):
+        widget = self.rows.get(key)
+        if widget is None:
+            widget = self.rows[key] = self.make_row(key)
+        return widget
+
+    def set_text(self, key, text):
+        if self.texts.get(key) != text:
+            self.row(key).configure(text=text)
+            self.texts[key] = text
+
+    def make_row(self, key):
+        kind = key[0]
+        if kind == "header":
+            return ttk.Label(self.parent, text=key[1], font=self.app.font_sub_header)
+        if kind == "sep":
+            return ttk.Separator(self.parent, orient='horizontal')
+        # Checkboxes edit the "selected" column so user can select tasks independently of completion
+        # (timer rows too; their text is filled in by set_text). The variable is attached when shown.
+        return ttk.Checkbutton(self.parent, text=row_text(key), command=self.command, style="Task.TCheckbutton")
+
+    def attach(self, key):
+        if key[0] in ("task", "timer"):
+            self.rows[key].configure(variable=self.app.var(self.column, key[1]))
+
+    def detach(self, key):
+        if key[0] in ("task", "timer"):
+            self.app.release_var(self.column, key[1])
+
+    def bind(self):
+        # Give every shown row its Tk variable back, e.g. when the window is shown again
+        if not self.bound:
+            self.bound = True
+            for key in self.shown:
+                self.attach(key)
+
+    def unbind(self):
+        # Withdrawn with its window: shown rows stay packed but drop their Tk variables
+        if self.bound:
+            self.bound = False
+            for key in self.shown:
+                self.detach(key)
+
+    def pack_row(self, key, widget, **where):
+        kind = key[0]
+        if kind == "header":
+            widget.pack(anchor="w", padx=10, pady=(5, 0), **where)
+        elif kind == "sep":
+            widget.pack(fill='x', padx=20, pady=4, **where)
+        else:
+            widget.pack(anchor="w", padx=20, **where)
+
+    def render(self, plan):
+        if plan == self.shown:
+            return
+        wanted = set(plan)
+        for key in self.shown:
+            if key not in wanted:
+                self.rows[key].pack_forget()
+                if self.bound:
+                    self.detach(key)
+
+        shown = set(self.shown)
+        prev = None
+        for key in plan:
+            widget = self.row(key)
+            if key not in shown:
+                if self.bound:
+                    self.attach(key)
+                if prev is not None:
+                    self.pack_row(key, widget, after=prev)
+                else:
+                    slaves = self.parent.pack_slaves()
+                    if slaves:
+                        self.pack_row(key, widget, before=slaves[0])
+                    else:
+                        self.pack_row(key, widget)
+            prev = widget
+        self.shown = plan
+
+    def update_viewport(self):
+        # Every row is a real widget, so scrolling needs no work here
+        pass
+
+
+class SettingsColumn(TaskColumn):
+    """Settings column whose section headers carry All/None buttons."""
+
+    def __init__(self, app, parent, kind):
+        super().__init__(app, parent, "pending", app.on_setting_change)
+        self.bound = False  # Built withdrawn; open_settings binds the rows
+        self.kind = kind
+
+    def make_row(self, key):
+        if key[0] != "header":
+            return super().make_row(key)
+        row = ttk.Frame(self.parent)
+        ttk.Label(row, text=key[1], font=self.app.font_sub_header).pack(side="left")
+        tasks = REGISTRY.section_ids[(self.kind, key[1])]
+        ttk.Button(row, text="None", width=5, command=lambda: self.app.set_pending_visibility(tasks, False)).pack(side="right")
+        ttk.Button(row, text="All", width=5, command=lambda: self.app.set_pending_visibility(tasks, True)).pack(side="right", padx=(10, 2))
+        return row
+
+    def pack_row(self, key, widget, **where):
+        if key[0] == "header":
+            widget.pack(fill="x", padx=10, pady=(5, 0), **where)
+        else:
+            super().pack_row(key, widget, **where)
+
+
+class VirtualTaskColumn:
+    """Task column that only materializes the rows inside the visible viewport.
+
+    The column is a canvas as tall as the whole plan. Rows scrolled into view (plus a
+    small overscan) borrow a widget from a per-kind pool and are placed with a canvas
+    window item; rows scrolled out of view hand their widget back to the pool.
+    """
+
+    ROW_HEIGHTS = {"header": 28, "sep": 9, "task": 24, "timer": 24}
+    OVERSCAN = 4
+
+    def __init__(self, app, parent):
+        self.app = app
+        self.canvas = tk.Canvas(parent, width=column_width(app), height=1, highlightthickness=0, bd=0)
+        self.canvas.pack(fill="both", expand=True)
+        self.plan = ()
+        self.offsets = []  # top y of each plan row, ascending
+        self.texts = {}    # row key -> text override (timer rows)
+        self.slots = {}    # row key -> (widget, window item) currently on screen
+        self.free = {kind: [] for kind in self.ROW_HEIGHTS}
+
+    def set_text(self, key, text):
+        self.texts[key] = text
+        if key in self.slots:
+            self.slots[key][0].configure(text=text)
+
+    def render(self, plan):
+        if plan == self.plan:
+            return
+        self.plan = plan
+        self.offsets = []
+        y = 0
+        for key in plan:
+            self.offsets.append(y)
+            y += self.ROW_HEIGHTS[key[0]]
+        self.canvas.configure(height=max(y, 1))
+        self.update_viewport()
+
+    def visible_range(self):
+        # Viewport of the main scroll area expressed in this column's coordinates
+        main = self.app.canvas
+        top = main.winfo_rooty() - self.canvas.winfo_rooty()
+        bottom = top + main.winfo_height()
+        first = max(bisect_right(self.offsets, top) - 1 - self.OVERSCAN, 0)
+        last = min(bisect_left(self.offsets, bottom) + self.OVERSCAN, len(self.plan))
+        return first, last
+
+    def update_viewport(self):
+        first, last = self.visible_range()
+        wanted = {self.plan[i]: i for i in range(first, last)}
+        for key in [key for key in self.slots if key not in wanted]:
+            widget, item = self.slots.pop(key)
+            self.canvas.itemconfigure(item, state="hidden")
+            if key[0] in ("task", "timer"):
+                # Off-screen rows keep no Tk variable; state stays in the TaskState columns
+                self.app.release_var("selected", key[1])
+            self.free[key[0]].append((widget, item))
+        for key, index in wanted.items():
+            slot = self.slots.get(key)
+            if slot is None:
+                slot = self.slots[key] = self.acquire(key)
+            x = 10 if key[0] == "header" else 20
+            self.canvas.coords(slot[1], x, self.offsets[index])
+
+    def acquire(self, key):
+        kind = key[0]
+        if self.free[kind]:
+            widget, item = self.free[kind].pop()
+            self.canvas.itemconfigure(item, state="normal")
+        else:
+            widget = self.make_row(kind)
+            options = {"width": int(self.canvas["width"]) - 40} if kind == "sep" else {}
+            item = self.canvas.create_window(0, 0, window=widget, anchor="nw", **options)
+        if kind in ("task", "timer"):
+            widget.configure(text=self.texts.get(key, row_text(key)), variable=self.app.var("selected", key[1]))
+        elif kind == "header":
+            widget.configure(text=key[1])
+        return widget, item
+
+    def make_row(self, kind):
+        if kind == "header":
+            return ttk.Label(self.canvas, font=self.app.font_sub_header)
+        if kind == "sep":
+            return ttk.Separator(self.canvas, orient='horizontal')
+        return ttk.Checkbutton(self.canvas, style="Task.TCheckbutton")
+
+
+class CanvasTaskColumn:
+    """Task column drawn as items on a single canvas, with no widget per task.
+
+    Headers, separators, check glyphs and labels are canvas items created once per
+    row key; a render only moves or hides them. Clicks are hit-tested against the row
+    offsets and toggle the row's selection state.
+    """
+
+    ROW_HEIGHTS = VirtualTaskColumn.ROW_HEIGHTS
+    GLYPHS = {False: "☐", True: "☑"}
+
+    def __init__(self, app, parent):
+        self.app = app
+        self.width = column_width(app)
+        self.canvas = tk.Canvas(parent, width=self.width, height=1, highlightthickness=0, bd=0)
+        self.canvas.pack(fill="both", expand=True)
+        self.canvas.bind("<Button-1>", self.on_click)
+        self.plan = ()
+        self.offsets = []
+        self.items = {}    # row key -> tuple of canvas item ids
+        self.texts = {}    # row key -> text override (timer rows)
+        # Glyphs follow core change events directly, so rows need no Tk variables
+        app.core.listeners.append(self.on_core_change)
+
+    def row_items(self, key):
+        items = self.items.get(key)
+        if items is None:
+            kind = key[0]
+            if kind == "header":
+                items = (self.canvas.create_text(10, 0, text=key[1], anchor="nw", font=self.app.font_sub_header),)
+            elif kind == "sep":
+                items = (self.canvas.create_line(20, 0, self.width - 20, 0, fill="#c0c0c0"),)
+            else:
+                glyph = self.canvas.create_text(20, 0, text=self.GLYPHS[self.app.state.get("selected", key[1])], anchor="nw", font=self.app.font_task)
+                label = self.canvas.create_text(42, 0, text=self.texts.get(key, row_text(key)), anchor="nw", font=self.app.font_task)
+                items = (glyph, label)
+            self.items[key] = items
+        return items
+
+    def set_text(self, key, text):
+        if self.texts.get(key) != text:
+            self.texts[key] = text
+            self.canvas.itemconfigure(self.row_items(key)[1], text=text)
+
+    def render(self, plan):
+        if plan == self.plan:
+            return
+        wanted = set(plan)
+        for key in self.plan:
+            if key not in wanted:
+                for item in self.items[key]:
+                    self.canvas.itemconfigure(item, state="hidden")
+        self.plan = plan
+        self.offsets = []
+        y = 0
+        for key in plan:
+            self.offsets.append(y)
+            for item in self.row_items(key):
+                self.canvas.itemconfigure(item, state="normal")
+                x = self.canvas.coords(item)[0]
+                if key[0] == "sep":
+                    self.canvas.coords(item, x, y + 4, self.width - 20, y + 4)
+                else:
+                    self.canvas.coords(item, x, y + 2)
+            y += self.ROW_HEIGHTS[key[0]]
+        self.canvas.configure(height=max(y, 1))
+
+    def on_core_change(self, changes):
+        for column, task_id in changes:
+            items = self.items.get(("task", task_id)) if column == "selected" else None
+            if items is not None:
+                self.canvas.itemconfigure(items[0], text=self.GLYPHS[self.app.state.get("selected", task_id)])
+
+    def on_click(self, event):
+        index = bisect_right(self.offsets, self.canvas.canvasy(event.y)) - 1
+        if 0 <= index < len(self.plan) and self.plan[index][0] in ("task", "timer"):
+            self.app.core.toggle_selected(self.plan[index][1])
+
+    def update_viewport(self):
+        # Canvas items are cheap enough to keep for every row
+        pass
+
+
+class TreeTaskColumn:
+    """Task column backed by a native ttk.Treeview.
+
+    Sections are parent nodes, tasks are child items with a check glyph column and
+    separators are empty spacer rows. Items are created once per row key and detached
+    or re-attached on render. The Treeview selection is mirrored into the selection state,
+    so Complete Checked acts on whatever is selected in the tree.
+    """
+
+    GLYPHS = CanvasTaskColumn.GLYPHS
+
+    def __init__(self, app, parent):
+        self.app = app
+        self.tree = ttk.Treeview(parent, columns=("check",), show="tree", selectmode="extended", height=1)
+        self.tree.column("#0", width=column_width(app), stretch=True)
+        self.tree.column("check", width=30, anchor="center", stretch=False)
+        self.tree.tag_configure("header", font=app.font_sub_header)
+        self.tree.tag_configure("task", font=app.font_task)
+        self.tree.pack(fill="both", expand=True)
+        self.tree.bind("<<TreeviewSelect>>", self.on_select)
+        app.core.listeners.append(self.on_core_change)
+        self.plan = ()
+        self.iids = {}     # row key -> tree item id
+        self.keys = {}     # tree item id -> row key
+        self.texts = {}    # row key -> text override (timer rows)
+
+    def item(self, key):
+        iid = self.iids.get(key)
+        if iid is None:
+            kind = key[0]
+            if kind == "header":
+                iid = self.tree.insert("", "end", text=key[1], open=True, tags=("header",))
+            elif kind == "sep":
+                iid = self.tree.insert("", "end", text="", tags=("sep",))
+            else:
+                selected = self.app.state.get("selected", key[1])
+                iid = self.tree.insert("", "end", text=self.texts.get(key, row_text(key)), values=(self.GLYPHS[selected],), tags=("task",))
+                if selected:
+                    self.tree.selection_add(iid)
+            self.iids[key] = iid
+            self.keys[iid] = key
+        return iid
+
+    def set_text(self, key, text):
+        if self.texts.get(key) != text:
+            self.texts[key] = text
+            self.tree.item(self.item(key), text=text)
+
+    def render(self, plan):
+        if plan == self.plan:
+            return
+        wanted = set(plan)
+        for key in self.plan:
+            if key not in wanted:
+                self.tree.detach(self.iids[key])
+        shown = set(self.plan)
+        section, headers, index = "", 0, 0
+        for key in plan:
+            iid = self.item(key)
+            if key[0] == "header":
+                if key not in shown:
+                    self.tree.move(iid, "", headers)
+                section, headers, index = iid, headers + 1, 0
+                continue
+            if key not in shown:
+                self.tree.move(iid, section, index)
+            index += 1
+        self.plan = plan
+        self.tree.configure(height=len(plan))
+
+    def on_select(self, event):
+        selected = set(self.tree.selection())
+        stray = [iid for iid in selected if self.keys[iid][0] not in ("task", "timer")]
+        if stray:
+            self.tree.selection_remove(stray)
+        with self.app.core.batch():
+            for key in self.plan:
+                if key[0] in ("task", "timer"):
+                    self.app.core.select(key[1], self.iids[key] in selected)
+
+    def on_core_change(self, changes):
+        for column, task_id in changes:
+            iid = self.iids.get(("task", task_id)) if column == "selected" else None
+            if iid is not None:
+                self.sync_selection(iid, self.app.state.get("selected", task_id))
+
+    def sync_selection(self, iid, selected):
+        self.tree.set(iid, "check", self.GLYPHS[selected])
+        if selected != (iid in self.tree.selection()):
+            if selected:
+                self.tree.selection_add(iid)
+            else:
+                self.tree.selection_remove(iid)
+
+    def update_viewport(self):
+        # Treeview keeps its own rows; nothing to materialize
+        pass
+
+
+RENDERERS = {"widgets": TaskColumn, "virtual": VirtualTaskColumn, "canvas": CanvasTaskColumn, "tree": TreeTaskColumn}
+
 
 class TaskTrackerApp:
-    def __init__(self, root):
+    # Extra delay past a computed label change so the wakeup lands after the boundary
+    WAKE_SLACK = 0.05
+    # --bench-live fails when the live countdowns use more than this fraction of one core
+    LIVE_CPU_BUDGET = 0.01
+
+    def __init__(self, root, renderer="widgets", low_power=False, live=False, clock=None):
         self.root = root
+        # Catalog, state, reset rules and persistence; this class is only the view over it
+        self.core = TrackerCore(clock)
+        self.clock = self.core.clock
+        self.state = self.core.state
+        self.renderer = RENDERERS[renderer]
+        self.low_power = low_power  # Wake only when visible text would change, instead of every minute
+        # At two decimals "Reset in" changes every 36 s; low-power shows one (every 6 min)
+        self.header_decimals = 1 if low_power else 2
+        self.live = live            # Per-second HH:MM:SS countdowns
+        self.hidden = False         # Minimized or fully covered: rendering is paused
         self.root.title("Warframe Task Tracker")
         self.root.geometry("700x700")
         self.load_window_position_and_size()
@@ -61,43 +588,39 @@ class TaskTrackerApp:
         self.font_button = ("Segoe UI", 12)
         self.font_gear_button = ("Segoe UI", 14)
 
+        self.scheduler = Scheduler(self.root, clock=lambda: self.clock().timestamp())
+        self.scheduler.clock_jump_listeners.append(self.check_for_reset)
+        self.scheduler.clock_jump_listeners.append(self.schedule_reminders)
+
         self.main_frame = ttk.Frame(self.root)
         self.main_frame.pack(fill="both", expand=True)
 
-        self.visibility_settings = {}
-        self.checked_tasks = {}   # Tracks which tasks are completed (hidden if True)
-        self.selection_vars = {}  # Tracks user checkbox selections in UI (separate from completion)
-
-        # Initialize variables for all tasks
-        for task_group in [DAILY_TASKS, WEEKLY_TASKS]:
-            for section in task_group:
-                for task in task_group[section]:
-                    if task != "---":
-                        self.visibility_settings[task] = tk.BooleanVar(value=True)
-                        self.checked_tasks[task] = tk.BooleanVar(value=False)
-                        self.selection_vars[task] = tk.BooleanVar(value=False)
+        # Tk variables mirror core state, and exist only for rows on screen
+        self.tk_vars = {}  # (column, task_id) -> [BooleanVar, trace id]
 
-        for task in EXTRA_TIMERS:
-            self.visibility_settings[task] = tk.BooleanVar(value=True)
-            self.checked_tasks[task] = tk.BooleanVar(value=False)
-            self.selection_vars[task] = tk.BooleanVar(value=False)
-
-        self.timer_labels = {task: tk.StringVar() for task in EXTRA_TIMERS}
+        self.timer_labels = dict.fromkeys(EXTRA_TIMERS, "")  # timer name -> current label text
         self.settings_window = None
-        self.last_reset_check = None
-        self.load_state()
+        self.apply_immediately = tk.BooleanVar(value=True)
+        self.core.load()
 
         self.create_header()
         self.create_scrollable_area()
         self.create_task_frames()
         self.populate_task_columns()
+        self.create_timer_frame()
         self.populate_timer_rows()
+        if self.live:
+            self.create_countdown_frame()
         self.create_bottom_ribbon()
         self.update_timer_labels()
 
+        self.watch_task_state()
+        self.watch_window_visibility()
+        self.root.after_idle(self.build_settings)
+
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         self.check_for_reset()
-        self.root.after(60000, self.check_for_reset)
+        self.schedule_reminders()
 
     def create_header(self):
         header_frame = ttk.Frame(self.main_frame)
@@ -110,24 +633,24 @@ class TaskTrackerApp:
         self.gear_btn.pack(side="right", padx=10)
 
         self.header_label = date_label
-        self.root.after(60000, self.update_time)
+        self.update_time()
 
         style = ttk.Style()
         style.configure("Gear.TButton", font=self.font_gear_button)
 
-    def open_settings(self):
-        if self.settings_window is not None and tk.Toplevel.winfo_exists(self.settings_window):
+    def build_settings(self):
+        # Built once (at idle after startup or on first open), then only withdrawn/deiconified
+        if self.settings_window is not None:
             return
-        self.gear_btn.config(state="disabled")
-
         self.settings_window = tk.Toplevel(self.root)
+        self.settings_window.withdraw()
         self.settings_window.title("Settings")
         self.settings_window.geometry("750x600")
         self.settings_window.protocol("WM_DELETE_WINDOW", self.close_settings)
 
         ttk.Label(self.settings_window, text="Show/Hide Tasks (Opt-In Filter)", font=self.font_main_header).pack(pady=5)
 
-        canvas = tk.Canvas(self.settings_window)
+        self.settings_canvas = canvas = tk.Canvas(self.settings_window)
         scrollable = ttk.Frame(canvas)
         scroll_y = ttk.Scrollbar(self.settings_window, orient="vertical", command=canvas.yview)
         canvas.configure(yscrollcommand=scroll_y.set)
@@ -135,8 +658,7 @@ class TaskTrackerApp:
         scroll_y.pack(side="right", fill="y")
         canvas.pack(side="left", fill="both", expand=True)
         canvas.create_window((0, 0), window=scrollable, anchor='nw')
-        scrollable.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.bind_all("<MouseWheel>", lambda event: canvas.yview_scroll(int(-1 * (event.delta / 120)), "units"))
+        self.watch_scrollregion(canvas, scrollable)
 
         content = ttk.Frame(scrollable)
         content.pack(fill="both", expand=True, padx=10, pady=5)
@@ -149,71 +671,81 @@ class TaskTrackerApp:
         ttk.Label(daily_col, text="Daily Tasks", font=self.font_col_header).pack(anchor="w", padx=5, pady=5)
         ttk.Label(weekly_col, text="Weekly Tasks", font=self.font_col_header).pack(anchor="w", padx=5, pady=5)
 
-        for section in DAILY_TASKS:
-            ttk.Label(daily_col, text=section, font=self.font_sub_header).pack(anchor="w", padx=10, pady=(5, 0))
-            for task in DAILY_TASKS[section]:
-                if task == "---":
-                    ttk.Separator(daily_col, orient='horizontal').pack(fill='x', padx=20, pady=4)
-                    continue
-                cb = ttk.Checkbutton(daily_col, text=task, variable=self.visibility_settings[task], command=self.on_setting_change, style="Task.TCheckbutton")
-                cb.pack(anchor="w", padx=20)
-
-        for section in WEEKLY_TASKS:
-            ttk.Label(weekly_col, text=section, font=self.font_sub_header).pack(anchor="w", padx=10, pady=(5, 0))
-            for i, task in enumerate(WEEKLY_TASKS[section]):
-                # Insert extra line breaks for specified places in quests only
-                if section == "Quests":
-                    # After "Archon Hunt"
-                    if task == "Archon Hunt":
-                        cb_task = True
-                    # After "Deep Archimedea"
-                    elif task == "Deep Archimedea":
-                        cb_task = True
-                    # After "Netracell"
-                    elif task == "Netracell":
-                        cb_task = True
-                    # After "Circuit"
-                    elif task == "Circuit":
-                        cb_task = True
-                    # After "SP Circuit"
-                    elif task == "SP Circuit":
-                        cb_task = True
-                    else:
-                        cb_task = True
-                else:
-                    cb_task = True
+        # Settings rows edit the "pending" column; apply_settings copies the diff into "visible"
+        self.settings_views = [
+            (SettingsColumn(self, daily_col, "daily"), "daily"),
+            (SettingsColumn(self, weekly_col, "weekly"), "weekly"),
+        ]
+        self.sync_settings_rows()
 
-                if task == "---":
-                    ttk.Separator(weekly_col, orient='horizontal').pack(fill='x', padx=20, pady=4)
-                    continue
+        apply_bar = ttk.Frame(content)
+        apply_bar.grid(row=1, column=0, columnspan=2, sticky="ew", padx=10, pady=10)
+        ttk.Checkbutton(apply_bar, text="Apply changes immediately", variable=self.apply_immediately, command=self.on_setting_change, style="Task.TCheckbutton").pack(side="left")
+        self.apply_btn = ttk.Button(apply_bar, text="Apply", command=self.apply_settings, style="Task.TButton", state="disabled")
+        self.apply_btn.pack(side="right")
 
-                cb = ttk.Checkbutton(weekly_col, text=task, variable=self.visibility_settings[task], command=self.on_setting_change, style="Task.TCheckbutton")
-                cb.pack(anchor="w", padx=20)
+    def sync_settings_rows(self):
+        # Pooled rows, so a catalog change only adds or removes the rows that differ
+        for view, kind in self.settings_views:
+            view.render(plan_layout(kind, SHOW_ALL))
 
-                # Add extra separator lines in weekly quests at specific points:
-                if section == "Quests":
-                    if task in ["Archon Hunt", "Deep Archimedea", "Netracell", "Circuit", "SP Circuit"]:
-                        ttk.Separator(weekly_col, orient='horizontal').pack(fill='x', padx=20, pady=4)
-
-        style = ttk.Style()
-        style.configure("Task.TCheckbutton", font=self.font_task)
+    def open_settings(self):
+        self.build_settings()
+        self.core.reset_pending()
+        for view, _ in self.settings_views:
+            view.bind()
+        self.apply_btn.config(state="disabled")
+        self.gear_btn.config(state="disabled")
+        self.bind_mousewheel(self.settings_canvas)
+        self.settings_window.deiconify()
+        self.settings_window.lift()
 
     def close_settings(self):
-        if self.settings_window:
-            self.settings_window.destroy()
-            self.settings_window = None
+        if self.settings_window is not None:
+            self.settings_window.withdraw()
+            for view, _ in self.settings_views:
+                view.unbind()
+        self.bind_mousewheel(self.canvas)
         self.gear_btn.config(state="normal")
 
+    def watch_scrollregion(self, canvas, frame):
+        # <Configure> fires once per packed row during a render; recompute the region at most
+        # once per idle cycle, and only when the frame's size actually changed
+        state = {"size": None, "job": None}
+
+        def update():
+            state["job"] = None
+            size = (frame.winfo_width(), frame.winfo_height())
+            if size != state["size"]:
+                state["size"] = size
+                canvas.configure(scrollregion=(0, 0) + size)
+
+        def on_configure(event):
+            if state["job"] is None and (event.width, event.height) != state["size"]:
+                state["job"] = canvas.after_idle(update)
+
+        frame.bind("<Configure>", on_configure)
+
+    def bind_mousewheel(self, canvas):
+        canvas.bind_all("<MouseWheel>", lambda event: canvas.yview_scroll(int(-1 * (event.delta / 120)), "units"))
+
     def get_date_string(self):
-        now = datetime.now()
-        utc_now = datetime.now(timezone.utc)
-        next_reset = (utc_now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        utc_now = self.clock()
+        now = utc_now.astimezone()
+        next_reset = next_daily_reset(utc_now)
         hours_to_reset = (next_reset - utc_now).total_seconds() / 3600
-        return f"{now.strftime('%a %m/%d/%y')} (Reset in {hours_to_reset:.2f} Hrs)"
+        return f"{now.strftime('%a %m/%d/%y')} (Reset in {hours_to_reset:.{self.header_decimals}f} Hrs)"
 
     def update_time(self):
+        if self.hidden:
+            # Resumed by show_window with a catch-up frame
+            return
         self.header_label.config(text=self.get_date_string())
-        self.root.after(60000, self.update_time)
+        if self.low_power:
+            now = self.clock().timestamp()
+            self.scheduler.at("header", next_header_change(now, self.header_decimals) + self.WAKE_SLACK, self.update_time)
+        else:
+            self.scheduler.schedule("header", 60, self.update_time)
 
     def load_window_position_and_size(self):
         if os.path.exists(WINDOW_POS_FILE):
@@ -249,87 +781,159 @@ class TaskTrackerApp:
             print(f"Failed to save window position and size: {e}")
 
     def check_for_reset(self):
-        now_utc = datetime.now(timezone.utc)
-        last_check_str = self.state_data.get("last_reset_check") if hasattr(self, "state_data") else None
-        if last_check_str:
+        # A rollover changes no core state; rows whose completion stamp went stale
+        # just render as incomplete again
+        self.dirty_views.update(("daily", "weekly", "timers"))
+        self.on_task_state_change(None)
+
+        # Sleep until the exact next rollover instead of polling every minute
+        self.scheduler.at("reset", self.core.next_rollover(), self.check_for_reset)
+
+    def schedule_reminders(self):
+        # Each reminder is one scheduler job armed for its next firing; nothing runs in between
+        now = self.clock().timestamp()
+        for index, reminder in enumerate(self.core.reminders):
+            self.arm_reminder(index, reminder, now)
+
+    def arm_reminder(self, index, reminder, after):
+        event_time = self.core.next_reminder(reminder, after)
+        if event_time is None:
+            return
+        lead = reminder.get("minutes_before", 0) * 60
+        self.scheduler.at(f"reminder:{index}", event_time - lead, lambda: self.fire_reminder(index, reminder, event_time))
+
+    def fire_reminder(self, index, reminder, event_time):
+        lead = reminder.get("minutes_before", 0) * 60
+        self.arm_reminder(index, reminder, event_time - lead)
+        message = self.core.reminder_message(reminder, event_time)
+        if message:
+            self.notify("Warframe Tracker", message)
+
+    def notify(self, title, message):
+        # Desktop notification (notify-send talks to the D-Bus notification service), else an in-app toast
+        if sys.platform.startswith("linux") and shutil.which("notify-send"):
             try:
-                last_check = datetime.fromisoformat(last_check_str)
-            except Exception:
-                last_check = None
+                subprocess.Popen(["notify-send", "--app-name=Warframe Tracker", title, message])
+                return
+            except OSError as e:
+                print(f"Failed to send notification: {e}")
+        toast = tk.Toplevel(self.root)
+        toast.overrideredirect(True)
+        toast.attributes("-topmost", True)
+        ttk.Label(toast, text=message, font=self.font_task, padding=10, relief="solid").pack()
+        toast.update_idletasks()
+        x = self.root.winfo_rootx() + self.root.winfo_width() - toast.winfo_reqwidth() - 20
+        y = self.root.winfo_rooty() + self.root.winfo_height() - toast.winfo_reqheight() - 60
+        toast.geometry(f"+{x}+{y}")
+        toast.after(8000, toast.destroy)
+
+    def watch_task_state(self):
+        self.dirty_views = set()
+        self.render_job = None
+        self.core.listeners.append(self.on_core_change)
+
+    def var(self, column, task_id):
+        # Tk variable mirroring one TaskState flag, created when a row goes on screen
+        entry = self.tk_vars.get((column, task_id))
+        if entry is None:
+            var = tk.BooleanVar(value=self.state.get(column, task_id))
+            if column == "selected":
+                trace = var.trace_add("write", lambda *_: self.core.select(task_id, var.get()))
+            else:
+                trace = var.trace_add("write", lambda *_: self.core.set_pending((task_id,), var.get()))
+            entry = self.tk_vars[(column, task_id)] = [var, trace]
+        return entry[0]
+
+    def release_var(self, column, task_id):
+        entry = self.tk_vars.pop((column, task_id), None)
+        if entry is not None:
+            entry[0].trace_remove("write", entry[1])
+
+    def on_core_change(self, changes):
+        # One core event per change or per batch; the render it triggers is coalesced at idle
+        for column, task_id in changes:
+            self.sync_row(column, task_id)
+
+    def sync_row(self, column, task_id):
+        entry = self.tk_vars.get((column, task_id))
+        if entry is not None and entry[0].get() != self.state.get(column, task_id):
+            entry[0].set(self.state.get(column, task_id))
+        # Route every completion/visibility change to the one view that shows the task
+        if column in ("visible", "completed"):
+            self.on_task_state_change(task_id)
+
+    def on_task_state_change(self, task_id):
+        # Coalesce all changes made in one event handler into a single render at idle
+        if task_id is not None:
+            self.dirty_views.add(REGISTRY.records[task_id].kind)
+        # While hidden, only remember what is dirty; show_window renders it in one go
+        if self.render_job is None and not self.hidden:
+            self.render_job = self.root.after_idle(self.render_dirty_views)
+
+    def render_dirty_views(self):
+        self.render_job = None
+        dirty, self.dirty_views = self.dirty_views, set()
+        if "daily" in dirty:
+            self.daily_view.render(self.plan_column("daily"))
+        if "weekly" in dirty:
+            self.weekly_view.render(self.plan_column("weekly"))
+        if "timers" in dirty:
+            self.populate_timer_rows()
+
+    def watch_window_visibility(self):
+        # Bindings on "." also fire for every descendant's Map/Unmap (each pack/pack_forget),
+        # so the handlers hang off a tag that only the root window carries
+        self.root.bindtags(("TrackerRoot",) + self.root.bindtags())
+        self.root.bind_class("TrackerRoot", "<Unmap>", lambda e: self.hide_window())
+        self.root.bind_class("TrackerRoot", "<Map>", lambda e: self.show_window())
+        # Only X11 reports occlusion; on Windows and macOS a window covered by another
+        # (e.g. the game) keeps rendering, and only minimizing pauses it
+        if self.root.tk.call("tk", "windowingsystem") == "x11":
+            self.main_frame.bind("<Visibility>", self.on_visibility)
+
+    def on_visibility(self, event):
+        # Fully covered (e.g. by the game) counts as hidden; any part exposed counts as shown
+        if event.state == "VisibilityFullyObscured":
+            self.hide_window()
         else:
-            last_check = None
-
-        today = now_utc.date()
-        is_sunday = now_utc.weekday() == 6
-        should_reset = (not last_check) or (last_check.date() < today)
-
-        if should_reset:
-            # Reset daily tasks (un-complete them)
-            for task in [t for s in DAILY_TASKS.values() for t in s if t != "---"]:
-                if task in self.checked_tasks:
-                    self.checked_tasks[task].set(False)
-                    self.selection_vars[task].set(False)  # Clear UI selection on reset
-            # Reset weekly tasks on Sunday
-            if is_sunday:
-                for task in [t for s in WEEKLY_TASKS.values() for t in s]:
-                    if task in self.checked_tasks:
-                        self.checked_tasks[task].set(False)
-                        self.selection_vars[task].set(False)  # Clear UI selection on reset
-
-            if not hasattr(self, "state_data"):
-                self.state_data = {}
-            self.state_data["last_reset_check"] = now_utc.isoformat()
-            self.refresh_task_lists()
-            self.save_state()
-
-        self.root.after(60000, self.check_for_reset)
-
-    def load_state(self):
-        self.state_data = {}
-        if os.path.exists(STATE_FILE):
-            try:
-                with open(STATE_FILE, "r") as f:
-                    self.state_data = json.load(f)
-                vis = self.state_data.get("visibility_settings", {})
-                for task, val in vis.items():
-                    if task in self.visibility_settings:
-                        self.visibility_settings[task].set(val)
-                checked = self.state_data.get("checked_tasks", {})
-                for task, val in checked.items():
-                    if task in self.checked_tasks:
-                        self.checked_tasks[task].set(val)
-                # Clear selection_vars on load (no persisted selection)
-                for task in self.selection_vars:
-                    self.selection_vars[task].set(False)
-            except Exception as e:
-                print(f"Failed to load state: {e}")
-
-    def save_state(self):
-        if not hasattr(self, "state_data"):
-            self.state_data = {}
-        self.state_data["visibility_settings"] = {task: var.get() for task, var in self.visibility_settings.items()}
-        self.state_data["checked_tasks"] = {task: var.get() for task, var in self.checked_tasks.items()}
-        # Note: selection_vars not saved (transient UI state)
-        try:
-            with open(STATE_FILE, "w") as f:
-                json.dump(self.state_data, f, indent=4)
-        except Exception as e:
-            print(f"Failed to save state: {e}")
+            self.show_window()
 
-    def refresh_task_lists(self):
-        self.populate_task_columns()
-        self.populate_timer_rows()
+    def hide_window(self):
+        # Pause all rendering; the reset job keeps running since it only does bookkeeping
+        if self.hidden:
+            return
+        self.hidden = True
+        self.scheduler.cancel("header")
+        self.scheduler.cancel("timers")
+        self.scheduler.cancel("countdown")
+
+    def show_window(self):
+        if not self.hidden:
+            return
+        self.hidden = False
+        self.update_time()
+        self.update_timer_labels()
+        if self.live:
+            self.tick_countdowns()
+        self.on_task_state_change(None)
 
     def create_scrollable_area(self):
         self.canvas = tk.Canvas(self.main_frame)
         self.scroll_frame = ttk.Frame(self.canvas)
         scrollbar = ttk.Scrollbar(self.main_frame, orient="vertical", command=self.canvas.yview)
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        self.canvas.configure(yscrollcommand=lambda first, last: self.on_main_scroll(scrollbar, first, last))
         scrollbar.pack(side="right", fill="y")
         self.canvas.pack(side="left", fill="both", expand=True)
         self.canvas.create_window((0, 0), window=self.scroll_frame, anchor='nw')
-        self.scroll_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-        self.canvas.bind_all("<MouseWheel>", lambda event: self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units"))
+        self.watch_scrollregion(self.canvas, self.scroll_frame)
+        self.bind_mousewheel(self.canvas)
+
+    def on_main_scroll(self, scrollbar, first, last):
+        scrollbar.set(first, last)
+        # Virtualized columns materialize rows for the new viewport
+        if hasattr(self, "weekly_view"):
+            self.daily_view.update_viewport()
+            self.weekly_view.update_viewport()
 
     def create_task_frames(self):
         content_frame = ttk.Frame(self.scroll_frame)
@@ -345,50 +949,17 @@ class TaskTrackerApp:
         self.weekly_col = ttk.Frame(content_frame)
         self.weekly_col.grid(row=1, column=1, padx=10, sticky="nw")
 
+        self.daily_view = self.renderer(self, self.daily_col)
+        self.weekly_view = self.renderer(self, self.weekly_col)
+
     def populate_task_columns(self):
-        for widget in self.daily_col.winfo_children(): widget.destroy()
-        for widget in self.weekly_col.winfo_children(): widget.destroy()
-
-        def add_tasks(parent, task_list):
-            last_was_sep = False
-            for task in task_list:
-                if task == "---":
-                    if not last_was_sep:
-                        ttk.Separator(parent, orient='horizontal').pack(fill='x', padx=20, pady=4)
-                        last_was_sep = True
-                    continue
-                # Show task only if visibility_settings True AND task not completed (checked_tasks False)
-                if self.visibility_settings[task].get() and not self.checked_tasks[task].get():
-                    # Use selection_vars for checkbox state so user can select tasks independently of completion
-                    cb = ttk.Checkbutton(parent, text=task, variable=self.selection_vars[task], style="Task.TCheckbutton")
-                    cb.pack(anchor="w", padx=20)
-                    last_was_sep = False
-
-        for section in DAILY_TASKS:
-            ttk.Label(self.daily_col, text=section, font=self.font_sub_header).pack(anchor="w", padx=10, pady=(5, 0))
-            add_tasks(self.daily_col, DAILY_TASKS[section])
-
-        for category in ["Vendors", "Quests"]:
-            ttk.Label(self.weekly_col, text=category, font=self.font_sub_header).pack(anchor="w", padx=10, pady=(5, 0))
-            add_tasks(self.weekly_col, WEEKLY_TASKS[category])
-
-        # Add extra line breaks in weekly quests (after specific tasks)
-        # But only if the tasks are visible and not completed, to keep spacing consistent
-        weekly_quests_parent = self.weekly_col
-        quest_tasks = WEEKLY_TASKS["Quests"]
-        sep_inserted_indices = set()
-        insert_after_tasks = ["Archon Hunt", "Deep Archimedea", "Netracell", "Circuit", "SP Circuit"]
-
-        # Find the positions where to insert separators in UI (only if tasks are visible & not completed)
-        # We cannot insert arbitrary Tk separators in the middle of packed widgets easily,
-        # so the best approach is to insert them while packing tasks.
-        # The above add_tasks call already packs tasks, so instead,
-        # We'll handle separators inside add_tasks next update if needed.
-        # So here, let's skip adding separate separators.
+        self.daily_view.render(self.plan_column("daily"))
+        self.weekly_view.render(self.plan_column("weekly"))
 
-    def populate_timer_rows(self):
-        if hasattr(self, "timer_frame"):
-            self.timer_frame.destroy()
+    def plan_column(self, kind):
+        return self.core.plan(kind)
+
+    def create_timer_frame(self):
         self.timer_frame = ttk.LabelFrame(self.scroll_frame, text="Custom Timers")
         self.timer_frame.pack(fill="x", padx=10, pady=5)
 
@@ -397,118 +968,195 @@ class TaskTrackerApp:
         style = ttk.Style()
         style.configure("CustomTimer.TLabelframe.Label", font=self.font_col_header)
         self.timer_frame.configure(style="CustomTimer.TLabelframe")
-
-        for task in EXTRA_TIMERS:
-            if self.visibility_settings[task].get():
-                label = self.timer_labels[task].get()
-                if self.checked_tasks[task].get():
-                    label += " ✔"
-                # Timer tasks also use selection_vars to track user checkbox selection (not completion)
-                cb = ttk.Checkbutton(self.timer_frame, text=label, variable=self.selection_vars[task], style="Task.TCheckbutton")
-                cb.pack(anchor="w", padx=20)
-
         style.configure("Task.TCheckbutton", font=self.font_task)
 
-    def update_timer_labels(self):
-        utc_now = datetime.now(timezone.utc)
-
-        tenet_base = datetime(2025, 7, 3, tzinfo=timezone.utc)
-        coda_base = datetime(2025, 7, 5, tzinfo=timezone.utc)
-        baro_base = datetime(2025, 7, 11, 13, 0, tzinfo=timezone.utc)  # July 11, 2025 13:00 UTC
-
-        def next_reset(base, interval_days):
-            while base <= utc_now:
-                base += timedelta(days=interval_days)
-            return base
-
-        tenet_next = next_reset(tenet_base, 4)
-        coda_next = next_reset(coda_base, 4)
-        baro_next = next_reset(baro_base, 14)
-
-        def format_td(td):
-            days = td.days
-            hours = td.seconds // 3600
-            minutes = (td.seconds % 3600) // 60
-            return days, hours, minutes
-
-        tdelta_tenet = tenet_next - utc_now
-        tdelta_coda = coda_next - utc_now
-        tdelta_baro = baro_next - utc_now
+        self.timer_view = TaskColumn(self, self.timer_frame)
+
+    def create_countdown_frame(self):
+        frame = ttk.LabelFrame(self.scroll_frame, text="Countdowns", style="CustomTimer.TLabelframe")
+        frame.pack(fill="x", padx=10, pady=5)
+        self.countdown_labels = {}
+        self.countdown_texts = {}
+        for row, name in enumerate(COUNTDOWNS):
+            ttk.Label(frame, text=name, font=self.font_task).grid(row=row, column=0, sticky="w", padx=(20, 10))
+            self.countdown_labels[name] = ttk.Label(frame, font=self.font_task)
+            self.countdown_labels[name].grid(row=row, column=1, sticky="e")
+        self.countdown_ticks = 0
+        self.countdown_updates = 0
+        self.tick_countdowns()
+
+    def tick_countdowns(self):
+        if self.hidden:
+            return
+        now = self.clock().timestamp()
+        self.countdown_ticks += 1
+        for name, cadence in COUNTDOWNS.items():
+            text = format_countdown(cadence.next(now) - now)
+            # Only labels whose string changed cost a Tcl call
+            if self.countdown_texts.get(name) != text:
+                self.countdown_labels[name].config(text=text)
+                self.countdown_texts[name] = text
+                self.countdown_updates += 1
+        # One tick aligned just past each whole second
+        self.scheduler.at("countdown", int(now) + 1 + self.WAKE_SLACK, self.tick_countdowns)
+
+    def benchmark_live(self, seconds):
+        # CPU used by the live countdowns as a fraction of one core, measured after startup settles
+        def start():
+            cpu, wall, ticks = time.process_time(), time.perf_counter(), self.countdown_ticks
+            self.scheduler.schedule("benchmark", seconds, lambda: finish(cpu, wall, ticks))
+
+        def finish(cpu, wall, ticks):
+            cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+            self.bench_usage = cpu / wall
+            print(f"Live countdowns: {self.bench_usage:.3%} of one core over {wall:.1f}s "
+                  f"({self.countdown_ticks - ticks} ticks, {self.countdown_updates} label updates total, "
+                  f"budget {self.LIVE_CPU_BUDGET:.1%})")
+            self.root.destroy()
+
+        self.scheduler.schedule("benchmark", 2, start)
 
-        baro_last = baro_next - timedelta(days=14)
-        presence_end = baro_last + timedelta(hours=48)
+    def populate_timer_rows(self):
+        # Timer rows are persistent; a refresh only rewrites label text that actually changed
+        now = self.clock().timestamp()
+        plan = []
+        for task_id in REGISTRY.timer_ids:
+            if self.state.get("visible", task_id):
+                label = self.timer_labels[REGISTRY.records[task_id].name]
+                if self.core.is_completed(task_id, now):
+                    label += " ✔"
+                self.timer_view.set_text(("timer", task_id), label)
+                plan.append(("timer", task_id))
+        self.timer_view.render(plan)
 
-        days_baro, hours_baro, minutes_baro = format_td(tdelta_baro)
+    def update_timer_labels(self):
+        if self.hidden:
+            return
+        now = self.clock().timestamp()
+        for task in EXTRA_TIMERS:
+            self.timer_labels[task] = timer_label(task, now)
 
-        if baro_last <= utc_now < presence_end:
-            self.timer_labels["Baro Ki'Teer"].set(f"Baro Ki'Teer - Present (Returns in {days_baro}d {hours_baro}h)")
+        self.populate_timer_rows()
+        if not self.low_power:
+            self.scheduler.schedule("timers", 60, self.update_timer_labels)
+            return
+        changes = [next_timer_label_change(REGISTRY.records[task_id].name, now)
+                   for task_id in REGISTRY.timer_ids if self.state.get("visible", task_id)]
+        if changes:
+            self.scheduler.at("timers", min(changes) + self.WAKE_SLACK, self.update_timer_labels)
         else:
-            self.timer_labels["Baro Ki'Teer"].set(f"Baro Ki'Teer (Returns in {days_baro}d {hours_baro}h)")
-
-        self.timer_labels["Tenet Weapon Reset"].set(f"Tenet Weapon Reset (Next in {tdelta_tenet.days}d {tdelta_tenet.seconds//3600}h)")
-        self.timer_labels["Coda Weapon Reset"].set(f"Coda Weapon Reset (Next in {tdelta_coda.days}d {tdelta_coda.seconds//3600}h)")
-
-        self.refresh_task_lists()
-        self.root.after(60000, self.update_timer_labels)
+            self.scheduler.cancel("timers")
 
     def create_bottom_ribbon(self):
         frame = ttk.Frame(self.root)
         frame.pack(side="bottom", fill="x", pady=5)
 
+        ttk.Button(frame, text="Upcoming", command=self.open_upcoming, style="Task.TButton").pack(side="right", padx=5)
         ttk.Button(frame, text="Simulate Week", command=self.simulate_week_reset, style="Task.TButton").pack(side="right", padx=5)
         ttk.Button(frame, text="Simulate Day", command=self.simulate_day_reset, style="Task.TButton").pack(side="right", padx=5)
         ttk.Button(frame, text="Complete Checked", command=self.complete_tasks, style="Task.TButton").pack(side="right", padx=5)
         ttk.Button(frame, text="Reset", command=self.reset_tasks, style="Task.TButton").pack(side="right", padx=5)
 
+        if self.low_power:
+            # Report the wakeup budget so low-power behaviour can be verified
+            self.wakeup_label = ttk.Label(frame, font=self.font_task)
+            self.wakeup_label.pack(side="left", padx=10)
+            self.scheduler.wakeup_listeners.append(self.report_wakeups)
+            self.report_wakeups()
+
         style = ttk.Style()
         style.configure("Task.TButton", font=self.font_button)
 
+    def open_upcoming(self):
+        now = self.clock().timestamp()
+        horizon = self.core.event_horizon()
+        window = tk.Toplevel(self.root)
+        window.title("Upcoming Events")
+
+        ttk.Label(window, text="Next 24 Hours", font=self.font_col_header).pack(anchor="w", padx=10, pady=(10, 0))
+        for t, name in horizon.between(now, now + 86400) or [horizon.next_event(now)]:
+            when = datetime.fromtimestamp(t).strftime("%a %m/%d %H:%M")
+            ttk.Label(window, text=f"{when}  {name}  (in {format_countdown(t - now)})", font=self.font_task).pack(anchor="w", padx=20)
+
+        ttk.Button(window, text="Export .ics", command=self.export_calendar, style="Task.TButton").pack(anchor="e", padx=10, pady=10)
+
+    def export_calendar(self):
+        path = filedialog.asksaveasfilename(defaultextension=".ics", filetypes=[("iCalendar", "*.ics")], initialfile="warframe_resets.ics")
+        if not path:
+            return
+        try:
+            with open(path, "w", newline="") as f:
+                f.write(self.core.event_horizon().to_ics())
+        except Exception as e:
+            print(f"Failed to export calendar: {e}")
+
+    def report_wakeups(self):
+        self.wakeup_label.config(text=f"{self.scheduler.wakeups_per_hour()} wakeups/h")
+
     def reset_tasks(self):
-        # Reset completion state for all visible tasks (checked_tasks = False)
-        for task in self.checked_tasks:
-            if self.visibility_settings[task].get():
-                self.checked_tasks[task].set(False)
-        # Clear all UI selections (selection_vars = False)
-        for task in self.selection_vars:
-            self.selection_vars[task].set(False)
-        self.refresh_task_lists()
-        self.save_state()
+        self.core.reset_tasks()
 
     def complete_tasks(self):
-        # Complete only those tasks user has selected in UI (selection_vars True) and are visible
-        for task in self.checked_tasks:
-            if self.visibility_settings[task].get() and self.selection_vars[task].get():
-                self.checked_tasks[task].set(True)
-                self.selection_vars[task].set(False)  # Clear selection after completing
-        self.refresh_task_lists()
-        self.save_state()
+        self.core.complete_selected()
 
     def simulate_day_reset(self):
-        # Uncomplete all daily tasks
-        for task in [t for s in DAILY_TASKS.values() for t in s if t != "---"]:
-            self.checked_tasks[task].set(False)
-            self.selection_vars[task].set(False)
-        self.refresh_task_lists()
-        self.save_state()
+        self.core.clear_tasks(REGISTRY.daily_ids)
 
     def simulate_week_reset(self):
-        # Uncomplete all weekly tasks
-        for task in [t for s in WEEKLY_TASKS.values() for t in s]:
-            self.checked_tasks[task].set(False)
-            self.selection_vars[task].set(False)
-        self.refresh_task_lists()
-        self.save_state()
+        self.core.clear_tasks(REGISTRY.weekly_ids)
 
     def on_setting_change(self):
-        self.refresh_task_lists()
-        self.save_state()
+        if self.apply_immediately.get():
+            self.apply_settings()
+        else:
+            self.apply_btn.config(state="normal" if self.core.pending_diff() else "disabled")
+
+    def set_pending_visibility(self, tasks, value):
+        # Section-level All/None: edit every row first, then apply once
+        with self.core.batch():
+            self.core.set_pending(tasks, value)
+            self.on_setting_change()
+
+    def apply_settings(self):
+        # One render and one save for the whole diff
+        self.apply_btn.config(state="disabled")
+        self.core.apply_pending()
 
     def on_close(self):
-        self.save_state()
+        self.core.save()
         self.save_window_position_and_size()
         self.root.destroy()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Warframe Task Tracker")
+    parser.add_argument("--renderer", choices=sorted(RENDERERS), default="widgets",
+                        help="how the daily/weekly task columns are drawn")
+    parser.add_argument("--low-power", action="store_true",
+                        help="only wake up when a visible label would change, and report wakeups per hour")
+    parser.add_argument("--live", action="store_true",
+                        help="show per-second HH:MM:SS countdowns for resets and custom timers")
+    parser.add_argument("--bench-live", type=float, metavar="SECONDS",
+                        help="run with --live for SECONDS, print its CPU usage and exit non-zero above the budget")
+    parser.add_argument("--simulate", nargs=2, metavar=("START", "END"),
+                        help="replay an ISO date range headlessly and print every reset, timer transition and expired completion")
+    parser.add_argument("--step", type=int, default=60,
+                        help="clock sampling interval in seconds for --simulate (default: 60)")
+    args = parser.parse_args()
+
+    if args.simulate:
+        start, end = (datetime.fromisoformat(arg) for arg in args.simulate)
+        start, end = (d if d.tzinfo else d.replace(tzinfo=timezone.utc) for d in (start, end))
+        began = time.perf_counter()
+        transitions = simulate(start, end, args.step)
+        for t, name, transition in transitions:
+            print(f"{datetime.fromtimestamp(t, timezone.utc):%Y-%m-%d %H:%M:%S} UTC  {name} {transition}")
+        print(f"{len(transitions)} transitions in {time.perf_counter() - began:.3f}s")
+        raise SystemExit
+
     root = tk.Tk()
-    app = TaskTrackerApp(root)
+    app = TaskTrackerApp(root, renderer=args.renderer, low_power=args.low_power, live=args.live or bool(args.bench_live))
+    if args.bench_live:
+        app.benchmark_live(args.bench_live)
     root.mainloop()
+    if args.bench_live and getattr(app, "bench_usage", None) is not None and app.bench_usage > app.LIVE_CPU_BUDGET:
+        sys.exit(f"Live countdowns exceeded the CPU budget of {app.LIVE_CPU_BUDGET:.1%} of one core")
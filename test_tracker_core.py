@@ -0,0 +1,231 @@
+import json
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import tracker_core
+from tracker_core import CATALOG, CATALOG_FILE, COUNTDOWNS, EXTRA_TIMERS, REGISTRY, Catalog, TrackerCore, build_plan, next_timer_label_change, simulate, timer_label
+
+
+def brute_force(start, end, step):
+    # Reference replay: sample the clock every `step` seconds and compare against the previous sample
+    t0, t_end = start.timestamp(), end.timestamp()
+    periods = {name: cadence.index(t0) for name, cadence in COUNTDOWNS.items()}
+    active = {name: cadence.is_active(t0) for name, cadence in COUNTDOWNS.items()}
+    completed = {record.id: record.cadence.index(t0) for record in REGISTRY.records}
+    transitions = []
+    t = t0 + step
+    while t < t_end:
+        for name, cadence in COUNTDOWNS.items():
+            if cadence.index(t) != periods[name]:
+                transitions.append((t, name, "arrives" if cadence.window else "reset"))
+            elif active[name] and not cadence.is_active(t):
+                transitions.append((t, name, "leaves"))
+            periods[name], active[name] = cadence.index(t), cadence.is_active(t)
+        for record in REGISTRY.records:
+            if record.cadence.index(t) != completed[record.id]:
+                transitions.append((t, record.name, "expires"))
+                completed[record.id] = record.cadence.index(t)
+        t += step
+    return transitions
+
+
+def test_simulate_matches_brute_force():
+    start = datetime(2025, 7, 9, 7, 13, 29, tzinfo=timezone.utc)
+    end = start + timedelta(days=17)
+    for step in (60, 300, 3600):
+        assert simulate(start, end, step) == brute_force(start, end, step)
+
+
+def test_simulate_from_a_whole_hour_across_baro():
+    # Whole-hour samples while Baro is present land exactly on label changes
+    start = datetime(2025, 7, 10, 12, tzinfo=timezone.utc)
+    end = datetime(2025, 7, 14, 13, 30, tzinfo=timezone.utc)
+    transitions = simulate(start, end)
+    assert transitions == brute_force(start, end, 60)
+    assert [transition for _, name, transition in transitions
+            if name == "Baro Ki'Teer" and transition != "expires"] == ["arrives", "leaves"]
+
+
+def test_next_timer_label_change_is_strictly_later():
+    for hours in range(0, 24 * 30):
+        t = datetime(2025, 7, 1, tzinfo=timezone.utc).timestamp() + hours * 3600
+        for name in EXTRA_TIMERS:
+            assert next_timer_label_change(name, t) > t
+
+
+def while_loop_label(name, now):
+    # The stepping implementation the cadences replaced, kept as a reference
+    bases = {
+        "Tenet Weapon Reset": (datetime(2025, 7, 3, tzinfo=timezone.utc), 4),
+        "Coda Weapon Reset": (datetime(2025, 7, 5, tzinfo=timezone.utc), 4),
+        "Baro Ki'Teer": (datetime(2025, 7, 11, 13, tzinfo=timezone.utc), 14),
+    }
+    base, interval_days = bases[name]
+    while base <= now:
+        base += timedelta(days=interval_days)
+    delta = base - now
+    text = f"{delta.days}d {delta.seconds // 3600}h"
+    if name != "Baro Ki'Teer":
+        return f"{name} (Next in {text})"
+    last = base - timedelta(days=14)
+    if last <= now < last + timedelta(hours=48):
+        return f"{name} - Present (Returns in {text})"
+    return f"{name} (Returns in {text})"
+
+
+def test_timer_labels_match_the_while_loop():
+    rng = random.Random(13)
+    start = datetime(2025, 7, 11, 13, tzinfo=timezone.utc)
+    for _ in range(2000):
+        now = start + timedelta(seconds=rng.randrange(3 * 365 * 86400), microseconds=rng.randrange(10 ** 6))
+        for name in EXTRA_TIMERS:
+            assert timer_label(name, now.timestamp()) == while_loop_label(name, now)
+
+
+def test_completions_expire_at_their_reset():
+    start = datetime(2025, 7, 5, 23, 30, tzinfo=timezone.utc)  # Saturday
+    transitions = simulate(start, start + timedelta(hours=1))
+    midnight = datetime(2025, 7, 6, tzinfo=timezone.utc).timestamp()
+    expired = {name for t, name, transition in transitions if transition == "expires"}
+    assert all(t == midnight for t, _, _ in transitions)
+    # Sunday 00:00 UTC is both the daily and the weekly reset
+    assert expired == {REGISTRY.records[task_id].name for task_id in REGISTRY.daily_ids + REGISTRY.weekly_ids}
+    assert (midnight, "Daily Reset", "reset") in transitions
+    assert (midnight, "Weekly Reset", "reset") in transitions
+
+
+def catalog_data():
+    with open(CATALOG_FILE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("edit, message", [
+    (lambda data: data["columns"][1]["sections"][0]["tasks"].append("Sortie"), "Duplicate task name in catalog: 'Sortie'"),
+    (lambda data: data["columns"][0].update(cadence="Daily"), "Unknown cadence 'Daily' in column 'daily'"),
+    (lambda data: data["timers"].append("Nightwave"), "Unknown cadence 'Nightwave' in timers"),
+    (lambda data: data.update(hidden=["Nightwave"]), "Unknown task in catalog 'hidden': 'Nightwave'"),
+])
+def test_catalog_rejects_inconsistent_files(edit, message):
+    data = catalog_data()
+    edit(data)
+    with pytest.raises(ValueError, match=message):
+        Catalog(data)
+
+
+def test_plan_cache_evicts_least_recently_used():
+    tracker_core.PLANS["weekly"].clear()
+    hot = tracker_core.plan_layout("weekly", 1)
+    for mask in range(2, tracker_core.PLAN_CACHE_SIZE + 10):
+        assert tracker_core.plan_layout("weekly", 1) is hot
+        tracker_core.plan_layout("weekly", mask)
+    assert len(tracker_core.PLANS["weekly"]) == tracker_core.PLAN_CACHE_SIZE
+    assert 1 in tracker_core.PLANS["weekly"] and 2 not in tracker_core.PLANS["weekly"]
+
+
+def rescan_plan(core, kind):
+    # The previous planner: rebuild the whole mask from the state on every call
+    mask = 0
+    for task_id, bit in CATALOG.column_bits[kind]:
+        if core.state.get("visible", task_id) and not core.is_completed(task_id):
+            mask |= bit
+    return build_plan(CATALOG.layouts[kind], mask)
+
+
+def test_incremental_plan_matches_a_full_rescan(tmp_path):
+    rng = random.Random(7)
+    now = [datetime(2025, 10, 1, tzinfo=timezone.utc)]
+    core = TrackerCore(clock=lambda: now[0], state_file=tmp_path / "state.json")
+    for step in range(20000):
+        op, task_id = rng.random(), rng.randrange(len(REGISTRY))
+        if op < 0.3:
+            core.state.set("visible", task_id, rng.random() < 0.5)
+        elif op < 0.6:
+            core.set_completed(task_id, rng.random() < 0.5)
+        elif op < 0.7:
+            now[0] += timedelta(seconds=rng.randrange(86400))
+        elif op < 0.72:
+            with pytest.raises(ValueError):
+                with core.batch():
+                    core.state.set("visible", task_id, False)
+                    core.set_completed(task_id, True)
+                    raise ValueError
+        for kind in CATALOG.layouts:
+            assert core.plan(kind) == rescan_plan(core, kind), step
+
+
+def test_build_plan_collapses_separator_runs():
+    layout = [("A", ["---", "x", "---", "---", "y", "---"]), ("B", ["z", "---", "w"])]
+    assert build_plan(layout, 0b1111) == (
+        ("header", "A"), ("sep", "A", 0), ("task", "x"), ("sep", "A", 2), ("task", "y"), ("sep", "A", 5),
+        ("header", "B"), ("task", "z"), ("sep", "B", 1), ("task", "w"),
+    )
+    # Hiding the task between two separators leaves a single one
+    assert build_plan(layout, 0b1101) == (
+        ("header", "A"), ("sep", "A", 0), ("task", "x"), ("sep", "A", 2),
+        ("header", "B"), ("task", "z"), ("sep", "B", 1), ("task", "w"),
+    )
+
+
+def test_failed_batch_rolls_back_without_emitting_or_saving(tmp_path):
+    state_file = tmp_path / "state.json"
+    core = TrackerCore(clock=lambda: datetime(2025, 10, 1, tzinfo=timezone.utc), state_file=state_file)
+    sortie = REGISTRY.ids["Sortie"]
+    core.set_completed(REGISTRY.ids["Tribute"], True)
+    core.plan("daily")
+    before = core.state.snapshot()
+    events = []
+    core.listeners.append(events.append)
+    with pytest.raises(RuntimeError):
+        with core.batch():
+            core.set_completed(sortie, True)
+            core.state.set("visible", REGISTRY.ids["Kahl"], False)
+            core.select(sortie)
+            raise RuntimeError
+    assert core.state.snapshot() == before
+    assert events == [] and not state_file.exists()
+    assert core.plan("daily") == rescan_plan(core, "daily")
+
+
+def test_nested_batch_rolls_back_only_its_own_changes(tmp_path):
+    state_file = tmp_path / "state.json"
+    core = TrackerCore(clock=lambda: datetime(2025, 10, 1, tzinfo=timezone.utc), state_file=state_file)
+    sortie, kahl = REGISTRY.ids["Sortie"], REGISTRY.ids["Kahl"]
+    events = []
+    core.listeners.append(events.append)
+    with core.batch():
+        core.set_completed(sortie, True)
+        with pytest.raises(RuntimeError):
+            with core.batch():
+                core.set_completed(kahl, True)
+                raise RuntimeError
+    assert core.is_completed(sortie) and not core.is_completed(kahl)
+    assert len(events) == 1 and ("completed", sortie) in events[0]
+    with open(state_file, encoding="utf-8") as f:
+        assert list(json.load(f)["completed_period"]) == ["Sortie"]
+
+
+def test_load_migrates_checked_tasks(tmp_path):
+    # Files from before completion periods stored plain flags and the time of the last reset check
+    state_file = tmp_path / "state.json"
+    state_file.write_text(json.dumps({
+        "visibility_settings": {"Kahl": True},
+        "checked_tasks": {"Sortie": True, "Kahl": True, "Tribute": False, "Old Task": True},
+        "last_reset_check": datetime(2025, 10, 1, 10, tzinfo=timezone.utc).isoformat(),
+    }))
+    now = [datetime(2025, 10, 1, 20, tzinfo=timezone.utc)]
+    core = TrackerCore(clock=lambda: now[0], state_file=state_file)
+    core.load()
+    assert core.is_completed(REGISTRY.ids["Sortie"]) and core.is_completed(REGISTRY.ids["Kahl"])
+    assert not core.is_completed(REGISTRY.ids["Tribute"])
+    # The flags were valid for the period they were checked in, not the one the file is loaded in
+    now[0] += timedelta(days=1)
+    assert not core.is_completed(REGISTRY.ids["Sortie"]) and core.is_completed(REGISTRY.ids["Kahl"])
+    core.save()
+    data = json.loads(state_file.read_text())
+    assert "checked_tasks" not in data and "last_reset_check" not in data
+    assert data["completed_period"] == {
+        "Sortie": tracker_core.DAILY_RESET.index(datetime(2025, 10, 1, tzinfo=timezone.utc).timestamp()),
+        "Kahl": tracker_core.WEEKLY_RESET.index(datetime(2025, 10, 1, tzinfo=timezone.utc).timestamp()),
+    }
@@ -0,0 +1,667 @@
+"""Headless core of the Warframe Task Tracker.
+
+Task catalog (compiled from tracker_catalog.json), cadences, per-task state,
+reset rules, reminders and persistence, with no dependency on tkinter. The Tk app
+is a view over TrackerCore; the same core can drive command-line tools, services
+and benchmarks.
+"""
+
+from datetime import datetime, timedelta, timezone
+from bisect import bisect_right
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+import json
+import os
+
+STATE_FILE = "tasktracker_state.json"
+# Sections, tasks, separators, cadences and default visibility; shipped next to this module
+CATALOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tracker_catalog.json")
+CATALOG_VERSION = 1
+
+
+class Cadence:
+    """A periodic event: anchor instant, period and optional presence window.
+
+    All queries take and return UTC epoch seconds and are closed-form integer
+    arithmetic, so their cost does not grow with the time since the anchor.
+    """
+
+    def __init__(self, anchor, period, window=timedelta(0)):
+        self.anchor = int(anchor.timestamp())
+        self.period = int(period.total_seconds())
+        self.window = int(window.total_seconds())
+
+    def index(self, t):
+        # Number of the latest occurrence at or before t (negative before the anchor)
+        return (int(t // 1) - self.anchor) // self.period
+
+    def previous(self, t):
+        return self.anchor + self.index(t) * self.period
+
+    def next(self, t):
+        # First occurrence strictly after t
+        return self.previous(t) + self.period
+
+    def is_active(self, t):
+        return t - self.previous(t) < self.window
+
+
+class TaskRecord:
+    __slots__ = ("id", "name", "kind", "section", "cadence")
+
+    def __init__(self, task_id, name, kind, section, cadence):
+        self.id = task_id
+        self.name = name
+        self.kind = kind        # "daily", "weekly" or "timers": the view that shows the task
+        self.section = section
+        self.cadence = cadence  # rollover that un-completes the task
+
+
+class TaskRegistry:
+    """Stable integer ids for every task, with the id arrays bulk operations run over.
+
+    Ids follow catalog order (columns, then timers), so they are stable for a
+    given catalog. Names are only used at the edges: persistence and display.
+    """
+
+    def __init__(self, columns, timer_cadences):
+        self.records = []
+        self.ids = {}           # name -> id
+        self.section_ids = {}   # (kind, section) -> ids in display order
+        for kind, task_group, cadence in columns:
+            for section, tasks in task_group.items():
+                self.section_ids[(kind, section)] = tuple(self.add(task, kind, section, cadence) for task in tasks if task != "---")
+        self.timer_ids = tuple(self.add(name, "timers", None, cadence) for name, cadence in timer_cadences.items())
+        self.records = tuple(self.records)  # Complete: the registry is read-only from here on
+        self.cadences = tuple(dict.fromkeys(record.cadence for record in self.records))  # distinct, in catalog order
+        self.daily_ids = tuple(record.id for record in self.records if record.kind == "daily")
+        self.weekly_ids = tuple(record.id for record in self.records if record.kind == "weekly")
+        self.all_ids = tuple(range(len(self.records)))
+
+    def add(self, name, kind, section, cadence):
+        # Names key the layouts and the state file, so each must name exactly one task
+        if name in self.ids:
+            raise ValueError(f"Duplicate task name in catalog: {name!r}")
+        record = TaskRecord(len(self.records), name, kind, section, cadence)
+        self.records.append(record)
+        self.ids[name] = record.id
+        return record.id
+
+    def layout(self, task_group, sections):
+        # Hashable (section, row) tuples in display order: task ids, with "---" kept as separators
+        return tuple((section, tuple(task if task == "---" else self.ids[task] for task in task_group[section])) for section in sections)
+
+    def __len__(self):
+        return len(self.records)
+
+
+class Catalog:
+    """The catalog file compiled into the structures the tracker runs on.
+
+    Holds every named cadence, the task registry, each column's hashable layout
+    and the ids hidden by default. Compiled once at import; it takes well under a millisecond.
+    """
+
+    def __init__(self, data):
+        if data.get("version") != CATALOG_VERSION:
+            raise ValueError(f"Unsupported catalog version: {data.get('version')!r}")
+        self.cadences = {
+            name: Cadence(datetime.fromisoformat(spec["anchor"]), timedelta(hours=spec["period_hours"]),
+                          window=timedelta(hours=spec.get("window_hours", 0)))
+            for name, spec in data["cadences"].items()
+        }
+        columns = []
+        for column in data["columns"]:
+            kind = column["kind"]
+            if any(kind == other for other, _, _ in columns):
+                raise ValueError(f"Duplicate column in catalog: {kind!r}")
+            task_group = {}
+            for section in column["sections"]:
+                if section["name"] in task_group:
+                    raise ValueError(f"Duplicate section {section['name']!r} in column {kind!r}")
+                task_group[section["name"]] = section["tasks"]
+            columns.append((kind, task_group, self.cadence(column["cadence"], f"column {kind!r}")))
+        self.timers = tuple(data["timers"])
+        self.registry = TaskRegistry(columns, {name: self.cadence(name, "timers") for name in self.timers})
+        # Column layouts as hashable (section, task ids) tuples, in display order
+        self.layouts = {kind: self.registry.layout(task_group, list(task_group)) for kind, task_group, _ in columns}
+        self.column_cadences = {kind: cadence for kind, _, cadence in columns}
+        # Each column task's bit in that column's plan mask, in layout order (separators not counted)
+        self.column_bits = {
+            kind: tuple((task_id, 1 << bit) for bit, task_id in enumerate(
+                task_id for _, tasks in layout for task_id in tasks if task_id != "---"))
+            for kind, layout in self.layouts.items()
+        }
+        self.task_bits = {task_id: (kind, bit) for kind, bits in self.column_bits.items() for task_id, bit in bits}
+        unknown = [name for name in data.get("hidden", []) if name not in self.registry.ids]
+        if unknown:
+            raise ValueError(f"Unknown task in catalog 'hidden': {unknown[0]!r}")
+        self.hidden_ids = tuple(self.registry.ids[name] for name in data.get("hidden", []))
+
+    def cadence(self, name, where):
+        if name not in self.cadences:
+            raise ValueError(f"Unknown cadence {name!r} in {where}")
+        return self.cadences[name]
+
+
+def load_catalog(path=CATALOG_FILE):
+    with open(path, "r", encoding="utf-8") as f:
+        return Catalog(json.load(f))
+
+
+CATALOG = load_catalog()
+REGISTRY = CATALOG.registry
+DAILY_LAYOUT = CATALOG.layouts["daily"]
+WEEKLY_LAYOUT = CATALOG.layouts["weekly"]
+
+DAILY_RESET = CATALOG.cadences["Daily Reset"]
+WEEKLY_RESET = CATALOG.cadences["Weekly Reset"]
+TIMER_CADENCES = {name: CATALOG.cadences[name] for name in CATALOG.timers}
+EXTRA_TIMERS = list(CATALOG.timers)
+
+# Live countdowns shown in --live mode
+COUNTDOWNS = {"Daily Reset": DAILY_RESET, "Weekly Reset": WEEKLY_RESET, **TIMER_CADENCES}
+
+
+# Reminders fire `minutes_before` an event from COUNTDOWNS. With "tasks", they only fire
+# while one of those tasks is visible and still incomplete. Editable under "reminders"
+# in the state file.
+DEFAULT_REMINDERS = [
+    {"event": "Daily Reset", "minutes_before": 30, "tasks": ["Sortie"]},
+    {"event": "Baro Ki'Teer", "minutes_before": 60},
+]
+
+
+def timer_label(name, t):
+    cadence = TIMER_CADENCES[name]
+    remaining = int(cadence.next(t) - t)
+    days, hours = remaining // 86400, remaining % 86400 // 3600
+    if not cadence.window:
+        return f"{name} (Next in {days}d {hours}h)"
+    if cadence.is_active(t):
+        return f"{name} - Present (Returns in {days}d {hours}h)"
+    return f"{name} (Returns in {days}d {hours}h)"
+
+
+def format_countdown(seconds):
+    # HH:MM:SS, with a day count in front once the event is a day or more away
+    seconds = int(seconds)
+    clock = f"{seconds % 86400 // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+    return f"{seconds // 86400}d {clock}" if seconds >= 86400 else clock
+
+
+def next_timer_label_change(name, t):
+    # Hours are shown truncated, so the text changes when the remaining time drops below a whole hour
+    cadence = TIMER_CADENCES[name]
+    until_next = cadence.next(t) - t
+    change = until_next - int(until_next) // 3600 * 3600
+    if change <= 0:
+        change += 3600
+    if cadence.window and cadence.is_active(t):
+        change = min(change, cadence.previous(t) + cadence.window - t)
+    return t + change
+
+
+def next_header_change(t, decimals=2):
+    # "Reset in" is shown in hours to `decimals` places, which rounds over every
+    # 3600 / 10**decimals seconds (36 s at two places); the date part changes at local midnight
+    step = 3600 / 10 ** decimals
+    until_reset = DAILY_RESET.next(t) - t
+    change = until_reset - (round(until_reset / step) - 0.5) * step
+    if change <= 0:
+        change += step
+    local_midnight = (datetime.fromtimestamp(t) + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return min(t + change, local_midnight.timestamp())
+
+
+def next_daily_reset(utc_now):
+    # Daily reset is 00:00 UTC; the weekly reset is the daily reset that starts a Sunday
+    return datetime.fromtimestamp(DAILY_RESET.next(utc_now.timestamp()), timezone.utc)
+
+
+class EventHorizon:
+    """The next occurrences of every countdown event, precomputed in one pass.
+
+    Events are kept as parallel arrays sorted by time, so "what happens next" and
+    "what happens in the next 24h" are bisect lookups. The horizon is valid up to
+    `end`, the point where the fastest-repeating series runs out of occurrences.
+    """
+
+    def __init__(self, cadences, start, count=64):
+        events = []
+        ends = []
+        for name, cadence in cadences.items():
+            first = cadence.next(start)
+            events.extend((first + n * cadence.period, name, cadence.window) for n in range(count))
+            ends.append(first + (count - 1) * cadence.period)
+        events.sort()
+        self.start = start
+        self.end = min(ends)
+        self.times = [event[0] for event in events]
+        self.names = [event[1] for event in events]
+        self.durations = [event[2] for event in events]
+
+    def covers(self, t, span=0):
+        return self.start <= t and t + span <= self.end
+
+    def next_event(self, t):
+        index = bisect_right(self.times, t)
+        return (self.times[index], self.names[index]) if index < len(self.times) else None
+
+    def between(self, start, end):
+        first, last = bisect_right(self.times, start), bisect_right(self.times, end)
+        return list(zip(self.times[first:last], self.names[first:last]))
+
+    def to_ics(self):
+        def stamp(t):
+            return datetime.fromtimestamp(t, timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+        def escape(text):
+            return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+
+        lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Warframe Tracker//EN", "CALSCALE:GREGORIAN"]
+        created = stamp(self.start)
+        for t, name, duration in zip(self.times, self.names, self.durations):
+            lines += ["BEGIN:VEVENT",
+                      f"UID:{int(t)}-{name.replace(' ', '-').replace(chr(39), '')}@warframe-tracker",
+                      f"DTSTAMP:{created}",
+                      f"DTSTART:{stamp(t)}"]
+            # DTEND must be later than DTSTART; without it an event is an instant (RFC 5545 3.6.1)
+            if duration > 0:
+                lines.append(f"DTEND:{stamp(t + duration)}")
+            lines += [f"SUMMARY:{escape(name)}", "END:VEVENT"]
+        lines.append("END:VCALENDAR")
+        return "\r\n".join(lines) + "\r\n"
+
+
+class TaskState:
+    """Authoritative per-task state in compact columns indexed by task id.
+
+    Flag columns ("visible", "selected", "pending") are array('B'); completion periods
+    are array('q') with NOT_COMPLETED for tasks never completed. Listeners get
+    (column, task_id) after every actual change.
+    """
+
+    NOT_COMPLETED = -(2 ** 63)
+
+    def __init__(self, size):
+        self.flags = {
+            "visible": array("B", [1]) * size,   # Opt-in filter from settings
+            "selected": array("B", [0]) * size,  # UI checkbox selection (separate from completion)
+            "pending": array("B", [1]) * size,   # Unapplied visibility edits in the settings window
+        }
+        self.completed = array("q", [self.NOT_COMPLETED]) * size
+        self.listeners = []
+
+    def get(self, column, task_id):
+        return self.flags[column][task_id] == 1
+
+    def set(self, column, task_id, value):
+        values = self.flags[column]
+        if values[task_id] != value:
+            values[task_id] = value
+            self.notify(column, task_id)
+
+    def completed_period(self, task_id):
+        period = self.completed[task_id]
+        return None if period == self.NOT_COMPLETED else period
+
+    def set_completed_period(self, task_id, period):
+        period = self.NOT_COMPLETED if period is None else period
+        if self.completed[task_id] != period:
+            self.completed[task_id] = period
+            self.notify("completed", task_id)
+
+    def snapshot(self):
+        return {column: array("B", values) for column, values in self.flags.items()}, array("q", self.completed)
+
+    def restore(self, snapshot):
+        # Put back a snapshot without notifying; the caller knows what it is undoing
+        flags, completed = snapshot
+        for column, values in flags.items():
+            self.flags[column][:] = values
+        self.completed[:] = completed
+
+    def notify(self, column, task_id):
+        for listener in self.listeners:
+            listener(column, task_id)
+
+
+def row_text(key):
+    # Headers carry their section name; task and timer rows carry a task id
+    return key[1] if key[0] == "header" else REGISTRY.records[key[1]].name
+
+
+SHOW_ALL = -1  # plan mask with every task bit set
+PLAN_CACHE_SIZE = 128
+# Bounded LRU of built plans per column kind, keyed by mask: a lookup hashes one int, not the layout
+PLANS = {kind: OrderedDict() for kind in CATALOG.layouts}
+
+
+def plan_layout(kind, mask):
+    """Return the immutable row plan for a column ("daily" or "weekly") and mask.
+
+    Refreshes keep hitting a handful of masks, so the PLAN_CACHE_SIZE most recently
+    used plans per column are kept.
+    """
+    plans = PLANS[kind]
+    plan = plans.get(mask)
+    if plan is not None:
+        plans.move_to_end(mask)
+        return plan
+    plan = plans[mask] = build_plan(CATALOG.layouts[kind], mask)
+    if len(plans) > PLAN_CACHE_SIZE:
+        plans.popitem(last=False)
+    return plan
+
+
+def build_plan(layout, mask):
+    """Return the row plan for a column layout.
+
+    Bit n of mask is set when the n-th task of the layout (separators not counted)
+    should be shown. Runs of separators with no task between them collapse into one.
+    """
+    plan = []
+    bit = 0
+    for section, tasks in layout:
+        plan.append(("header", section))
+        last_was_sep = False
+        for index, task in enumerate(tasks):
+            if task == "---":
+                if not last_was_sep:
+                    plan.append(("sep", section, index))
+                    last_was_sep = True
+                continue
+            if mask >> bit & 1:
+                plan.append(("task", task))
+                last_was_sep = False
+            bit += 1
+    return tuple(plan)
+
+
+class TrackerCore:
+    """Task state, reset rules, reminders and persistence behind one small API.
+
+    Listeners are called with a set of (column, task_id) pairs that changed: once per
+    change, or once for a whole batch() of changes. A batch that touches a persisted
+    column ("visible" or "completed") is saved to disk once when it ends.
+    """
+
+    PERSISTED = ("visible", "completed")
+
+    def __init__(self, clock=None, state_file=STATE_FILE):
+        # Aware UTC "now"; injectable so reset and timer behaviour can be driven from tests
+        self.clock = clock or (lambda: datetime.now(timezone.utc))
+        self.state_file = state_file
+        self.registry = REGISTRY
+        self.state = TaskState(len(REGISTRY))
+        for task_id in CATALOG.hidden_ids:
+            self.state.flags["visible"][task_id] = self.state.flags["pending"][task_id] = 0
+        self.state_data = {}
+        self.horizon = None
+        self.masks = {}  # column kind -> (period, mask of rows to show in that period)
+        self.listeners = []
+        self.batch_depth = 0
+        self.batch_changes = set()  # (column, task_id) changed inside the open batch
+        self.state.listeners.append(self.on_state_change)
+
+    def now(self):
+        return self.clock().timestamp()
+
+    # Change events
+
+    @contextmanager
+    def batch(self):
+        """Group mutations into one change event and at most one save.
+
+        If the block raises, state is rolled back to where the batch started and the
+        exception propagates. An outermost batch then emits nothing and saves nothing.
+        """
+        snapshot = self.state.snapshot()
+        self.batch_depth += 1
+        try:
+            yield
+        except BaseException:
+            self.state.restore(snapshot)
+            self.masks.clear()  # Restored without notifications, so rebuild on the next plan
+            if self.batch_depth == 1:
+                self.batch_changes.clear()
+            raise
+        finally:
+            self.batch_depth -= 1
+        if self.batch_depth == 0:
+            self.commit_batch()
+
+    def commit_batch(self):
+        changes, self.batch_changes = self.batch_changes, set()
+        if not changes:
+            return
+        self.emit(changes)
+        if any(column in self.PERSISTED for column, _ in changes):
+            self.save()
+
+    def on_state_change(self, column, task_id):
+        if column in self.PERSISTED:
+            self.update_mask(task_id)
+        if self.batch_depth:
+            self.batch_changes.add((column, task_id))
+        else:
+            self.emit({(column, task_id)})
+
+    def emit(self, changes):
+        for listener in self.listeners:
+            listener(changes)
+
+    # Completion and resets
+
+    def is_completed(self, task_id, now=None):
+        now = self.now() if now is None else now
+        return self.state.completed[task_id] == REGISTRY.records[task_id].cadence.index(now)
+
+    def set_completed(self, task_id, completed):
+        period = REGISTRY.records[task_id].cadence.index(self.now()) if completed else None
+        self.state.set_completed_period(task_id, period)
+
+    def next_rollover(self, now=None):
+        # Completion is stamped with its period index, so a rollover changes no state;
+        # views only need to re-render at the earliest next rollover of any task cadence
+        now = self.now() if now is None else now
+        return min(cadence.next(now) for cadence in REGISTRY.cadences)
+
+    def plan(self, kind, now=None):
+        # The column's mask is kept up to date by on_state_change; it is only rebuilt
+        # from scratch when the column's cadence rolls over into a new period
+        now = self.now() if now is None else now
+        period = CATALOG.column_cadences[kind].index(now)
+        entry = self.masks.get(kind)
+        if entry is None or entry[0] != period:
+            entry = self.masks[kind] = (period, self.column_mask(kind, period))
+        return plan_layout(kind, entry[1])
+
+    def column_mask(self, kind, period):
+        # Show task only if visible per settings AND not completed in the current period
+        mask = 0
+        for task_id, bit in CATALOG.column_bits[kind]:
+            if self.shown(task_id, period):
+                mask |= bit
+        return mask
+
+    def shown(self, task_id, period):
+        return self.state.flags["visible"][task_id] == 1 and self.state.completed[task_id] != period
+
+    def update_mask(self, task_id):
+        kind, bit = CATALOG.task_bits.get(task_id, (None, 0))
+        entry = self.masks.get(kind)
+        if entry is not None:
+            period, mask = entry
+            self.masks[kind] = (period, mask | bit if self.shown(task_id, period) else mask & ~bit)
+
+    def reset_tasks(self):
+        with self.batch():
+            # Reset completion state for all visible tasks
+            for task_id in REGISTRY.all_ids:
+                if self.state.get("visible", task_id):
+                    self.set_completed(task_id, False)
+            # Clear all selections
+            for task_id in REGISTRY.all_ids:
+                self.state.set("selected", task_id, False)
+
+    def complete_selected(self):
+        with self.batch():
+            # Complete only those tasks that are selected and visible
+            for task_id in REGISTRY.all_ids:
+                if self.state.get("visible", task_id) and self.state.get("selected", task_id):
+                    self.set_completed(task_id, True)
+                    self.state.set("selected", task_id, False)  # Clear selection after completing
+
+    def clear_tasks(self, task_ids):
+        # Un-complete and deselect a group of tasks, as a reset of their cadence would
+        with self.batch():
+            for task_id in task_ids:
+                self.set_completed(task_id, False)
+                self.state.set("selected", task_id, False)
+
+    def select(self, task_id, selected=True):
+        self.state.set("selected", task_id, selected)
+
+    def toggle_selected(self, task_id):
+        self.select(task_id, not self.state.get("selected", task_id))
+
+    # Visibility settings
+
+    def reset_pending(self):
+        # Start settings edits from the live visibility, dropping unapplied ones
+        with self.batch():
+            for task_id in REGISTRY.all_ids:
+                self.state.set("pending", task_id, self.state.get("visible", task_id))
+
+    def set_pending(self, task_ids, value):
+        with self.batch():
+            for task_id in task_ids:
+                self.state.set("pending", task_id, value)
+
+    def pending_diff(self):
+        return [task_id for task_id in REGISTRY.all_ids
+                if self.state.get("pending", task_id) != self.state.get("visible", task_id)]
+
+    def apply_pending(self):
+        with self.batch():
+            for task_id in self.pending_diff():
+                self.state.set("visible", task_id, self.state.get("pending", task_id))
+
+    # Timers and reminders
+
+    def event_horizon(self, span=7 * 86400):
+        # Rebuilt only once the precomputed horizon no longer covers the requested window
+        now = self.now()
+        if self.horizon is None or not self.horizon.covers(now, span):
+            self.horizon = EventHorizon(COUNTDOWNS, now)
+        return self.horizon
+
+    @property
+    def reminders(self):
+        return self.state_data.setdefault("reminders", [dict(r) for r in DEFAULT_REMINDERS])
+
+    def next_reminder(self, reminder, after):
+        # Time of the next event this reminder fires for, or None for an unknown event
+        cadence = COUNTDOWNS.get(reminder.get("event"))
+        if cadence is None:
+            return None
+        return cadence.next(after + reminder.get("minutes_before", 0) * 60)
+
+    def reminder_message(self, reminder, event_time, now=None):
+        # Only visible timers and visible, still-incomplete tasks trigger a reminder
+        now = self.now() if now is None else now
+        name = reminder["event"]
+        if name in REGISTRY.ids and not self.state.get("visible", REGISTRY.ids[name]):
+            return None
+        task_ids = [REGISTRY.ids[task] for task in reminder.get("tasks", []) if task in REGISTRY.ids]
+        pending = [REGISTRY.records[task_id].name for task_id in task_ids
+                   if self.state.get("visible", task_id) and not self.is_completed(task_id, now)]
+        if "tasks" in reminder and not pending:
+            return None
+        message = f"{name} in {round((event_time - now) / 60)} min"
+        if pending:
+            message += f" - still incomplete: {', '.join(pending)}"
+        return message
+
+    # Persistence
+
+    def load(self):
+        self.state_data = {}
+        if os.path.exists(self.state_file):
+            try:
+                with open(self.state_file, "r") as f:
+                    self.state_data = json.load(f)
+                # Persisted by task name so ids can change with the catalog
+                vis = self.state_data.get("visibility_settings", {})
+                for task, val in vis.items():
+                    if task in REGISTRY.ids:
+                        self.state.set("visible", REGISTRY.ids[task], val)
+                for task, period in self.state_data.get("completed_period", {}).items():
+                    if task in REGISTRY.ids:
+                        self.state.set_completed_period(REGISTRY.ids[task], period)
+                # Files from older versions stored plain flags; those were valid for the period of the last reset check
+                checked = self.state_data.pop("checked_tasks", {})
+                last_check = self.state_data.pop("last_reset_check", None)
+                checked_at = datetime.fromisoformat(last_check).timestamp() if last_check else self.now()
+                for task, val in checked.items():
+                    task_id = REGISTRY.ids.get(task)
+                    if val and task_id is not None and self.state.completed_period(task_id) is None:
+                        self.state.set_completed_period(task_id, REGISTRY.records[task_id].cadence.index(checked_at))
+            except Exception as e:
+                print(f"Failed to load state: {e}")
+
+    def save(self):
+        self.state_data["visibility_settings"] = {record.name: self.state.get("visible", record.id) for record in REGISTRY.records}
+        self.state_data["completed_period"] = {record.name: self.state.completed_period(record.id)
+                                               for record in REGISTRY.records if self.state.completed_period(record.id) is not None}
+        # Note: selection not saved (transient UI state)
+        try:
+            with open(self.state_file, "w") as f:
+                json.dump(self.state_data, f, indent=4)
+        except Exception as e:
+            print(f"Failed to save state: {e}")
+
+
+def simulate(start, end, step=60):
+    """Replay [start, end) headlessly through a TrackerCore on a simulated clock.
+
+    Every task starts completed and is completed again as soon as a reset clears it.
+    Returns (time, name, transition) for every reset, timer rollover and presence
+    change, followed at the same time by (time, task, "expires") for each completion
+    the rollover cleared, as seen by a clock sampled every `step` seconds from `start`.
+    Rather than visiting every sample, it jumps to the next boundary rounded up to
+    the sampling grid, which gives the same result in time proportional to the events.
+    """
+    t0, t_end = start.timestamp(), end.timestamp()
+    t = t0
+    core = TrackerCore(clock=lambda: datetime.fromtimestamp(t, timezone.utc))
+    for task_id in REGISTRY.all_ids:
+        core.set_completed(task_id, True)
+    periods = {name: cadence.index(t0) for name, cadence in COUNTDOWNS.items()}
+    present = {name: cadence.is_active(t0) for name, cadence in TIMER_CADENCES.items()}
+    transitions = []
+    while True:
+        # Presence windows end between rollovers; everything else changes at one
+        boundary = min([core.next_rollover(t)] + [cadence.previous(t) + cadence.window
+                                                  for name, cadence in TIMER_CADENCES.items() if present[name]])
+        # Always advance by at least one sample, whatever the boundary
+        t = max(t0 + -(-(boundary - t0) // step) * step, t + step)
+        if t >= t_end:
+            return transitions
+        for name, cadence in COUNTDOWNS.items():
+            period = cadence.index(t)
+            if period != periods[name]:
+                transitions.append((t, name, "arrives" if cadence.window else "reset"))
+                periods[name] = period
+        for name, cadence in TIMER_CADENCES.items():
+            now_present = cadence.is_active(t)
+            if present[name] and not now_present:
+                transitions.append((t, name, "leaves"))
+            present[name] = now_present
+        for task_id in REGISTRY.all_ids:
+            if not core.is_completed(task_id):
+                transitions.append((t, REGISTRY.records[task_id].name, "expires"))
+                core.set_completed(task_id, True)